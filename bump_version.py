@@ -6,6 +6,14 @@ from pathlib import Path
 
 from update_version import update_pyproject_version
 
+# Index of the version component each bump type increments
+_BUMP = {"major": 0, "minor": 1, "patch": 2}
+
+
+def _bump_parts(parts: tuple, index: int) -> tuple:
+    """Increment the component at index and reset the ones after it."""
+    return (*parts[:index], parts[index] + 1, *(0,) * (len(parts) - index - 1))
+
 
 def bump_version(version_type="patch"):
     """Bump version according to semantic versioning."""
@@ -15,9 +23,13 @@ def bump_version(version_type="patch"):
         print(".version file not found!")
         return
 
+    index = _BUMP.get(version_type)
+    if index is None:
+        print(f"Invalid version type: {version_type}. Use 'major', 'minor', or 'patch'")
+        return
+
     # Read current version
-    with open(version_file, "r") as f:
-        current_version = f.read().strip()
+    current_version = version_file.read_text(encoding="ascii").strip()
 
     # Parse version components
     parts = current_version.split(".")
@@ -25,30 +37,13 @@ def bump_version(version_type="patch"):
         print(f"Invalid version format: {current_version}")
         return
 
-    major, minor, patch = map(int, parts)
-
-    # Bump version according to type
-    if version_type == "major":
-        major += 1
-        minor = 0
-        patch = 0
-    elif version_type == "minor":
-        minor += 1
-        patch = 0
-    elif version_type == "patch":
-        patch += 1
-    else:
-        print(f"Invalid version type: {version_type}. Use 'major', 'minor', or 'patch'")
-        return
-
-    new_version = f"{major}.{minor}.{patch}"
+    new_version = ".".join(map(str, _bump_parts(tuple(map(int, parts)), index)))
 
     # Update .version file
-    with open(version_file, "w") as f:
-        f.write(new_version + "\n")
+    version_file.write_text(new_version + "\n", encoding="ascii")
 
     # Update pyproject.toml
-    update_pyproject_version()
+    update_pyproject_version(new_version)
 
     print(f"Version bumped from {current_version} to {new_version}")
     print("Updated .version and pyproject.toml files")
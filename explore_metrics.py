@@ -3,13 +3,17 @@
 Script to explore available metrics in Prometheus
 """
 
-import requests
+import asyncio
 
+import httpx
 
-def get_metrics():
+PROMETHEUS_URL = "http://localhost:9090"
+
+
+async def get_metrics(client):
     """Get list of all available metrics"""
     try:
-        response = requests.get("http://localhost:9090/api/v1/label/__name__/values")
+        response = await client.get("/api/v1/label/__name__/values")
         if response.status_code == 200:
             data = response.json()
             return data.get("data", [])
@@ -21,12 +25,10 @@ def get_metrics():
         return []
 
 
-def get_metric_values(metric_name):
+async def get_metric_values(client, metric_name):
     """Get current values for a specific metric"""
     try:
-        response = requests.get(
-            f"http://localhost:9090/api/v1/query?query={metric_name}"
-        )
+        response = await client.get("/api/v1/query", params={"query": metric_name})
         if response.status_code == 200:
             data = response.json()
             return data.get("data", {}).get("result", [])
@@ -38,49 +40,57 @@ def get_metric_values(metric_name):
         return []
 
 
-def main():
+async def main():
     print("🔍 Exploring Prometheus Metrics")
     print("=" * 50)
 
-    # Get all available metrics
-    metrics = get_metrics()
+    # Share one keep-alive connection pool across all queries
+    async with httpx.AsyncClient(base_url=PROMETHEUS_URL) as client:
+        # Get all available metrics
+        metrics = await get_metrics(client)
 
-    if not metrics:
-        print("❌ No metrics found. Make sure Prometheus is running and scraping data.")
-        return
+        if not metrics:
+            print(
+                "❌ No metrics found. Make sure Prometheus is running and scraping data."
+            )
+            return
 
-    print(f"📊 Found {len(metrics)} metrics:")
-    print()
+        print(f"📊 Found {len(metrics)} metrics:")
+        print()
 
-    # Filter and display relevant metrics
-    relevant_metrics = [
-        "up",
-        "http_requests_total",
-        "http_errors_total",
-        "http_request_duration_seconds",
-        "active_connections",
-        "python_gc_collections_total",
-        "process_cpu_seconds_total",
-        "process_resident_memory_bytes",
-    ]
-
-    for metric in relevant_metrics:
-        if metric in metrics:
-            print(f"✅ {metric}")
-            values = get_metric_values(metric)
-            if values:
-                print(f"   📈 Current values: {len(values)} series")
-                # Show a sample
-                if len(values) > 0:
-                    sample = values[0]
-                    if "metric" in sample:
-                        labels = sample["metric"]
-                        # Remove __name__ from labels for cleaner display
-                        labels.pop("__name__", None)
-                        print(f"   📋 Sample labels: {labels}")
-            else:
-                print("   ⚠️  No current values")
-            print()
+        # Filter and display relevant metrics
+        relevant_metrics = [
+            "up",
+            "http_requests_total",
+            "http_errors_total",
+            "http_request_duration_seconds",
+            "active_connections",
+            "python_gc_collections_total",
+            "process_cpu_seconds_total",
+            "process_resident_memory_bytes",
+        ]
+        available = [metric for metric in relevant_metrics if metric in metrics]
+
+        # Query all metrics concurrently instead of one round-trip at a time
+        results = await asyncio.gather(
+            *(get_metric_values(client, metric) for metric in available)
+        )
+
+    for metric, values in zip(available, results):
+        print(f"✅ {metric}")
+        if values:
+            print(f"   📈 Current values: {len(values)} series")
+            # Show a sample
+            if len(values) > 0:
+                sample = values[0]
+                if "metric" in sample:
+                    labels = sample["metric"]
+                    # Remove __name__ from labels for cleaner display
+                    labels.pop("__name__", None)
+                    print(f"   📋 Sample labels: {labels}")
+        else:
+            print("   ⚠️  No current values")
+        print()
 
     print("🌐 To explore in Prometheus web UI:")
     print("   1. Go to http://localhost:9090")
@@ -100,4 +110,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -4,47 +4,100 @@ Generate release notes for GitHub releases based on conventional commits.
 """
 
 import os
+import re
 import subprocess
 import sys
-from typing import Dict, List, Optional
-
-
-def get_commits_since_tag(tag: Optional[str] = None) -> List[str]:
-    """Get commits since the last tag or all commits if no tag exists."""
+from typing import Dict, Iterable, Iterator, List, Optional
+
+_TYPES = frozenset(
+    {
+        "feat",
+        "fix",
+        "docs",
+        "style",
+        "refactor",
+        "perf",
+        "test",
+        "chore",
+        "ci",
+        "build",
+        "revert",
+    }
+)
+_CONV_RE = re.compile(rf"^({'|'.join(sorted(_TYPES))})(\([^)]+\))?(!)?: (.+)$")
+_BREAKING_SUBSTR = "BREAKING CHANGE"
+
+# Release note bucket for each parsed commit type; anything else is "other"
+_BUCKETS = {
+    "breaking": "breaking",
+    "feat": "feat",
+    "fix": "fix",
+    "docs": "docs",
+    "chore": "chore",
+}
+_PREFIXES = {
+    "breaking": "- **BREAKING**: ",
+    "feat": "- ",
+    "fix": "- ",
+    "docs": "- ",
+    "chore": "- ",
+    "other": "- ",
+}
+
+
+def iter_commits_since_tag(tag: Optional[str] = None) -> Iterator[str]:
+    """Yield commit subjects since the last tag, or all commits if no tag exists."""
     if tag:
         cmd = ["git", "log", "--pretty=format:%s", f"{tag}..HEAD"]
     else:
         cmd = ["git", "log", "--pretty=format:%s", "--reverse"]
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        return []
+    # Stream git's output so commits are categorized while git is still reading
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    ) as proc:
+        for line in iter(proc.stdout.readline, b""):
+            line = line.decode("utf-8", errors="replace").strip()
+            if line:
+                yield line
+
 
-    return [line.strip() for line in result.stdout.split("\n") if line.strip()]
+def get_commits_since_tag(tag: Optional[str] = None) -> List[str]:
+    """Get commits since the last tag or all commits if no tag exists."""
+    return list(iter_commits_since_tag(tag))
 
 
 def parse_conventional_commit(commit: str) -> Dict[str, str]:
     """Parse a conventional commit message."""
     # Check for breaking changes
-    if "BREAKING CHANGE" in commit:
+    if _BREAKING_SUBSTR in commit:
         return {
             "type": "breaking",
             "message": commit.split(": ", 1)[1] if ": " in commit else commit,
         }
 
-    # Check for conventional commit format
-    import re
-
-    pattern = r"^(feat|fix|docs|style|refactor|perf|test|chore|ci|build|revert)(\([^)]+\))?: (.+)$"
-    match = re.match(pattern, commit)
+    # Fast path for the common "type(scope)!: message" shape, which only
+    # needs string splits and a set lookup
+    head, sep, message = commit.partition(": ")
+    if sep and message and "\n" not in message:
+        bang = head.endswith("!")
+        commit_type, paren, scope = head.removesuffix("!").partition("(")
+        if commit_type in _TYPES and (
+            not paren or (len(scope) > 1 and scope.find(")") == len(scope) - 1)
+        ):
+            if bang:
+                return {"type": "breaking", "message": message}
+            return {"type": commit_type, "scope": scope.strip("()"), "message": message}
+
+    # Fall back to the full conventional commit regex for anything unusual
+    match = _CONV_RE.match(commit)
 
     if match:
-        commit_type = match.group(1)
-        scope = match.group(2) if match.group(2) else ""
-        message = match.group(3)
+        commit_type, scope, bang, message = match.groups()
+        scope = scope or ""
 
         # Check for breaking change indicator
-        if commit.startswith(f"{commit_type}{scope}!"):
+        if bang:
             return {"type": "breaking", "message": message}
 
         return {"type": commit_type, "scope": scope.strip("()"), "message": message}
@@ -52,28 +105,16 @@ def parse_conventional_commit(commit: str) -> Dict[str, str]:
     return {"type": "other", "message": commit}
 
 
-def categorize_commits(commits: List[str]) -> Dict[str, List[str]]:
+def categorize_commits(commits: Iterable[str]) -> Dict[str, List[str]]:
     """Categorize commits by type."""
-    categories = {
-        "breaking": [],
-        "feat": [],
-        "fix": [],
-        "docs": [],
-        "chore": [],
-        "other": [],
-    }
+    categories = {bucket: [] for bucket in _PREFIXES}
 
     for commit in commits:
         parsed = parse_conventional_commit(commit)
-        commit_type = parsed["type"]
-        message = parsed["message"]
-
-        if commit_type == "breaking":
-            categories["breaking"].append(f"- **BREAKING**: {message}")
-        elif commit_type in categories:
-            categories[commit_type].append(f"- {message}")
-        else:
-            categories["other"].append(f"- {commit}")
+        bucket = _BUCKETS.get(parsed["type"], "other")
+        # Uncategorized commits keep their full subject, type prefix included
+        message = commit if bucket == "other" else parsed["message"]
+        categories[bucket].append(_PREFIXES[bucket] + message)
 
     return categories
 
@@ -155,16 +196,13 @@ def main():
     version = sys.argv[1]
     previous_tag = sys.argv[2] if len(sys.argv) > 2 else None
 
-    # Get commits since last tag
-    commits = get_commits_since_tag(previous_tag)
+    # Categorize commits since last tag as git produces them
+    categories = categorize_commits(iter_commits_since_tag(previous_tag))
 
-    if not commits:
+    if not any(categories.values()):
         print("No commits found")
         sys.exit(1)
 
-    # Categorize commits
-    categories = categorize_commits(commits)
-
     # Generate release body
     release_body = generate_release_body(version, categories)
 
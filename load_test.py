@@ -6,23 +6,38 @@ Generates various types of traffic to test monitoring and alerting.
 
 import argparse
 import asyncio
+import bisect
 import random
-import statistics
 import time
-from typing import Dict, List
+from collections import defaultdict, deque
+from typing import Deque, Dict, Optional
 
 import aiohttp
+import numpy as np
 
 
 class LoadTester:
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(
+        self, base_url: str = "http://localhost:8000", max_connections: int = 200
+    ):
         self.base_url = base_url
+        self.max_connections = max_connections
+        # Endpoint mixes, with cumulative weights precomputed for the hot loop
+        # (40% simulate, 30% health, 20% root, 10% config)
+        self._normal_endpoints = ("/", "/health", "/simulate", "/config")
+        self._normal_cum = (0.2, 0.5, 0.9, 1.0)
+        self._burst_endpoints = ("/", "/health", "/simulate")
         self.session = None
-        self.results: List[Dict] = []
+        self.results: Deque[Dict] = deque()
 
     async def __aenter__(self):
         timeout = aiohttp.ClientTimeout(total=10)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        # Pool enough keep-alive connections for the highest RPS phase
+        # and cache DNS lookups across the whole run
+        connector = aiohttp.TCPConnector(
+            limit=0, limit_per_host=self.max_connections, ttl_dns_cache=300
+        )
+        self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -30,122 +45,117 @@ class LoadTester:
             await self.session.close()
 
     async def make_request(self, endpoint: str) -> Dict:
-        """Make a single request and return timing information."""
-        start_time = time.time()
+        """Make a single request, record and return timing information."""
+        start_time = time.perf_counter()
         try:
             async with self.session.get(f"{self.base_url}{endpoint}") as response:
-                duration = time.time() - start_time
-                return {
+                duration = time.perf_counter() - start_time
+                # The body is never used, hand the connection back right away
+                response.release()
+                result = {
                     "endpoint": endpoint,
                     "status": response.status,
                     "duration": duration,
                     "success": response.status < 400,
                 }
         except Exception as e:
-            duration = time.time() - start_time
-            return {
+            duration = time.perf_counter() - start_time
+            result = {
                 "endpoint": endpoint,
                 "status": 0,
                 "duration": duration,
                 "success": False,
                 "error": str(e),
             }
+        self.results.append(result)
+        return result
 
     async def normal_load(self, duration: int = 60, rps: int = 10):
         """Generate normal load with occasional errors."""
         print(f"Generating normal load: {rps} RPS for {duration} seconds")
 
-        start_time = time.time()
-        tasks = []
-
-        while time.time() - start_time < duration:
-            # Choose endpoint based on weights
-            endpoints = ["/", "/health", "/simulate", "/config"]
-            weights = [0.2, 0.3, 0.4, 0.1]  # 40% simulate, 30% health, etc.
-
-            endpoint = random.choices(endpoints, weights=weights)[0]
-            task = asyncio.create_task(self.make_request(endpoint))
-            tasks.append(task)
-
-            # Wait to maintain RPS
-            await asyncio.sleep(1.0 / rps)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        end_time = deadline + duration
 
-        # Wait for all tasks to complete with timeout
+        # The task group drains outstanding requests on exit
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True), timeout=duration + 10
-            )
-            self.results.extend([r for r in results if isinstance(r, dict)])
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(duration + 10):
+                async with asyncio.TaskGroup() as tg:
+                    while loop.time() < end_time:
+                        # Choose endpoint based on weights
+                        endpoint = self._normal_endpoints[
+                            bisect.bisect_right(self._normal_cum, random.random())
+                        ]
+                        tg.create_task(self.make_request(endpoint))
+
+                        # Sleep until the next scheduled send to maintain RPS
+                        # without drift
+                        deadline += 1.0 / rps
+                        await asyncio.sleep(max(0.0, deadline - loop.time()))
+        except TimeoutError:
             print("Warning: Some requests timed out")
 
-        print(
-            f"Completed {len([r for r in self.results if isinstance(r, dict)])} "
-            f"requests"
-        )
+        print(f"Completed {len(self.results)} requests")
 
     async def error_load(self, duration: int = 30, rps: int = 5):
         """Generate load that triggers errors."""
         print(f"Generating error load: {rps} RPS for {duration} seconds")
 
-        start_time = time.time()
-        tasks = []
-
-        while time.time() - start_time < duration:
-            # Mix normal requests with error endpoints
-            if random.random() < 0.7:  # 70% error endpoints
-                endpoint = "/error"
-            else:
-                endpoint = "/simulate"
-
-            task = asyncio.create_task(self.make_request(endpoint))
-            tasks.append(task)
-
-            await asyncio.sleep(1.0 / rps)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        end_time = deadline + duration
 
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True),
-                timeout=duration + 10,
-            )
-            self.results.extend([r for r in results if isinstance(r, dict)])
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(duration + 10):
+                async with asyncio.TaskGroup() as tg:
+                    while loop.time() < end_time:
+                        # Mix normal requests with error endpoints
+                        if random.random() < 0.7:  # 70% error endpoints
+                            endpoint = "/error"
+                        else:
+                            endpoint = "/simulate"
+
+                        tg.create_task(self.make_request(endpoint))
+
+                        deadline += 1.0 / rps
+                        await asyncio.sleep(max(0.0, deadline - loop.time()))
+        except TimeoutError:
             print("Warning: Some requests timed out")
 
-        print(
-            f"Completed {len([r for r in self.results if isinstance(r, dict)])} "
-            f"error requests"
-        )
+        print(f"Completed {len(self.results)} error requests")
 
-    async def burst_load(self, duration: int = 10, rps: int = 50):
+    async def burst_load(
+        self, duration: int = 10, rps: int = 50, max_in_flight: Optional[int] = None
+    ):
         """Generate burst load to test high traffic scenarios."""
         print(f"Generating burst load: {rps} RPS for {duration} seconds")
 
-        start_time = time.time()
-        tasks = []
-
-        while time.time() - start_time < duration:
-            # Create multiple concurrent requests
-            for _ in range(rps // 10):  # Create batches
-                endpoint = random.choice(["/", "/health", "/simulate"])
-                task = asyncio.create_task(self.make_request(endpoint))
-                tasks.append(task)
-
-            await asyncio.sleep(0.1)  # Small delay between batches
+        # Bound outstanding requests (and their tasks) even if rps is set
+        # higher than the server or connection pool can keep up with
+        in_flight = asyncio.Semaphore(max_in_flight or self.max_connections)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        end_time = deadline + duration
 
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True),
-                timeout=duration + 10,
-            )
-            self.results.extend([r for r in results if isinstance(r, dict)])
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(duration + 10):
+                async with asyncio.TaskGroup() as tg:
+                    while loop.time() < end_time:
+                        # Create multiple concurrent requests
+                        for _ in range(rps // 10):  # Create batches
+                            await in_flight.acquire()
+                            endpoint = self._burst_endpoints[random.randrange(3)]
+                            task = tg.create_task(self.make_request(endpoint))
+                            task.add_done_callback(lambda _: in_flight.release())
+
+                        # Small delay between batches, scheduled against a deadline
+                        deadline += 0.1
+                        await asyncio.sleep(max(0.0, deadline - loop.time()))
+        except TimeoutError:
             print("Warning: Some requests timed out")
 
-        print(
-            f"Completed {len([r for r in self.results if isinstance(r, dict)])} "
-            f"burst requests"
-        )
+        print(f"Completed {len(self.results)} burst requests")
 
     def print_summary(self):
         """Print a summary of the load test results."""
@@ -157,7 +167,11 @@ class LoadTester:
         successful_requests = sum(1 for r in self.results if r.get("success", False))
         error_requests = total_requests - successful_requests
 
-        durations = [r["duration"] for r in self.results]
+        durations = np.fromiter(
+            (r["duration"] for r in self.results),
+            dtype=np.float64,
+            count=total_requests,
+        )
 
         print("\n" + "=" * 50)
         print("LOAD TEST SUMMARY")
@@ -167,29 +181,24 @@ class LoadTester:
         print(f"Successful: {successful_requests} ({success_rate:.1f}%)")
         error_rate = error_requests / total_requests * 100
         print(f"Errors: {error_requests} ({error_rate:.1f}%)")
-        print(f"Average Response Time: {statistics.mean(durations):.3f}s")
-        print(f"Median Response Time: {statistics.median(durations):.3f}s")
-        percentile_95 = sorted(durations)[int(len(durations) * 0.95)]
+        print(f"Average Response Time: {durations.mean():.3f}s")
+        print(f"Median Response Time: {np.median(durations):.3f}s")
+        percentile_95 = np.quantile(durations, 0.95, method="higher")
         print(f"95th Percentile: {percentile_95:.3f}s")
-        print(f"Min Response Time: {min(durations):.3f}s")
-        print(f"Max Response Time: {max(durations):.3f}s")
+        print(f"Min Response Time: {durations.min():.3f}s")
+        print(f"Max Response Time: {durations.max():.3f}s")
 
         # Endpoint breakdown
-        endpoint_stats = {}
+        endpoint_stats = defaultdict(lambda: [0, 0])  # [total, success]
         for result in self.results:
-            endpoint = result["endpoint"]
-            if endpoint not in endpoint_stats:
-                endpoint_stats[endpoint] = {"total": 0, "success": 0}
-            endpoint_stats[endpoint]["total"] += 1
-            if result.get("success", False):
-                endpoint_stats[endpoint]["success"] += 1
+            stats = endpoint_stats[result["endpoint"]]
+            stats[0] += 1
+            stats[1] += result.get("success", False)
 
         print("\nEndpoint Breakdown:")
-        for endpoint, stats in endpoint_stats.items():
-            success_rate = stats["success"] / stats["total"] * 100
-            print(
-                f"  {endpoint}: {stats['total']} requests, {success_rate:.1f}% success"
-            )
+        for endpoint, (total, success) in endpoint_stats.items():
+            success_rate = success / total * 100
+            print(f"  {endpoint}: {total} requests, {success_rate:.1f}% success")
 
 
 async def main():
@@ -233,4 +242,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer the libuv-based event loop when it is available
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -7,7 +7,7 @@ from datetime import datetime
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
     Counter,
@@ -31,6 +31,7 @@ app = FastAPI(
     title=app_info["title"],
     version=app_info["version"],
     description=app_info["description"],
+    default_response_class=ORJSONResponse,
 )
 
 # Prometheus metrics
@@ -41,51 +42,73 @@ REQUEST_LATENCY = Histogram("http_request_duration_seconds", "HTTP request laten
 ACTIVE_CONNECTIONS = Gauge("active_connections", "Number of active connections")
 ERROR_RATE = Counter("http_errors_total", "Total HTTP errors", ["endpoint"])
 
-# Simulated application state
-active_connections = 0
+# Cached label children, keyed by label values
+_req_count_cache: dict[tuple, Counter] = {}
+_error_rate_cache: dict[str, Counter] = {}
+
+# Rendered /metrics payload, reused by scrapes within METRICS_CACHE_TTL seconds
+METRICS_CACHE_TTL = 0.5
+_metrics_cache: tuple[float, bytes] = (float("-inf"), b"")
+_metrics_lock = asyncio.Lock()
+
+
+def _route_path(request) -> str:
+    """Return the matched route template, falling back to the raw URL path."""
+    route = request.scope.get("route")
+    return route.path if route is not None else request.url.path
+
+
+def _count_request(method: str, endpoint: str, status: int):
+    """Increment the cached request counter child for these labels."""
+    key = (method, endpoint, status)
+    child = _req_count_cache.get(key) or _req_count_cache.setdefault(
+        key, REQUEST_COUNT.labels(*key)
+    )
+    child.inc()
+
+
+def _count_error(endpoint: str):
+    """Increment the cached error counter child for an endpoint."""
+    child = _error_rate_cache.get(endpoint) or _error_rate_cache.setdefault(
+        endpoint, ERROR_RATE.labels(endpoint)
+    )
+    child.inc()
 
 
 @app.middleware("http")
 async def monitor_requests(request, call_next):
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Increment active connections
-    global active_connections
-    active_connections += 1
-    ACTIVE_CONNECTIONS.set(active_connections)
+    ACTIVE_CONNECTIONS.inc()
 
     try:
         response = await call_next(request)
 
         # Record metrics
-        REQUEST_COUNT.labels(
-            method=request.method,
-            endpoint=request.url.path,
-            status=response.status_code,
-        ).inc()
+        endpoint = _route_path(request)
+        _count_request(request.method, endpoint, response.status_code)
 
         # Track errors based on HTTP status codes (4xx and 5xx)
         if response.status_code >= 400:
-            ERROR_RATE.labels(endpoint=request.url.path).inc()
+            _count_error(endpoint)
 
-        REQUEST_LATENCY.observe(time.time() - start_time)
+        REQUEST_LATENCY.observe(time.perf_counter() - start_time)
 
         return response
     except Exception:
         # Track errors from exceptions
-        ERROR_RATE.labels(endpoint=request.url.path).inc()
+        endpoint = _route_path(request)
+        _count_error(endpoint)
 
         # Still record the request as an error
-        REQUEST_COUNT.labels(
-            method=request.method, endpoint=request.url.path, status=500
-        ).inc()
+        _count_request(request.method, endpoint, 500)
 
-        REQUEST_LATENCY.observe(time.time() - start_time)
+        REQUEST_LATENCY.observe(time.perf_counter() - start_time)
         raise
     finally:
         # Decrement active connections
-        active_connections -= 1
-        ACTIVE_CONNECTIONS.set(active_connections)
+        ACTIVE_CONNECTIONS.dec()
 
 
 @app.get("/")
@@ -109,15 +132,24 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": time.time(),
-        "active_connections": active_connections,
+        "active_connections": int(ACTIVE_CONNECTIONS._value.get()),
     }
 
 
 @app.get("/metrics")
 async def metrics():
     """Prometheus metrics endpoint"""
+    global _metrics_cache
+
+    # Serialize regeneration so concurrent scrapes render the payload once
+    async with _metrics_lock:
+        now = time.monotonic()
+        if now - _metrics_cache[0] > METRICS_CACHE_TTL:
+            _metrics_cache = (now, generate_latest())
+        payload = _metrics_cache[1]
+
     return Response(
-        generate_latest(),
+        payload,
         media_type=CONTENT_TYPE_LATEST,
     )
 
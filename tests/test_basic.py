@@ -6,8 +6,9 @@ Basic tests for the Observer application
 import pytest
 from fastapi.testclient import TestClient
 
+import main
 from main import app
-from version import get_version
+from version import get_version, read_version
 
 client = TestClient(app)
 
@@ -48,6 +49,24 @@ def test_metrics_endpoint():
     assert "active_connections" in content
 
 
+def test_metrics_endpoint_cached_within_ttl(monkeypatch):
+    """Test that scrapes within the TTL reuse the rendered metrics payload"""
+    monkeypatch.setattr(main, "METRICS_CACHE_TTL", float("inf"))
+    first = client.get("/metrics")
+    client.get("/health")
+    second = client.get("/metrics")
+    assert first.content == second.content
+
+
+def test_metrics_endpoint_regenerated_after_ttl(monkeypatch):
+    """Test that a scrape after the TTL renders a fresh metrics payload"""
+    monkeypatch.setattr(main, "METRICS_CACHE_TTL", -1.0)
+    first = client.get("/metrics")
+    client.get("/health")
+    second = client.get("/metrics")
+    assert first.content != second.content
+
+
 def test_simulate_endpoint():
     """Test the simulate endpoint (may return error due to randomness)"""
     response = client.get("/simulate")
@@ -80,6 +99,11 @@ def test_app_metadata():
     assert app.version == get_version()
 
 
+def test_get_version_matches_version_file():
+    """Test that the cached version matches the .version file"""
+    assert get_version() == read_version()
+
+
 def test_test_feature_endpoint():
     """Test the new test-feature endpoint."""
     response = client.get("/test-feature")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for release notes generation
+"""
+
+import subprocess
+
+import pytest
+
+from generate_release_notes import (
+    categorize_commits,
+    iter_commits_since_tag,
+    parse_conventional_commit,
+)
+
+
+@pytest.fixture
+def git_repo(tmp_path, monkeypatch):
+    """Create a throwaway git repository and run the test inside it"""
+
+    def git(*args):
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+            + list(args),
+            cwd=tmp_path,
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    monkeypatch.chdir(tmp_path)
+    return git
+
+
+def test_parse_commit_with_scope():
+    """Test that a scoped commit returns its type, scope and message"""
+    assert parse_conventional_commit("feat(api): add endpoint") == {
+        "type": "feat",
+        "scope": "api",
+        "message": "add endpoint",
+    }
+
+
+def test_parse_commit_without_scope():
+    """Test that an unscoped commit has an empty scope"""
+    assert parse_conventional_commit("fix: handle timeout") == {
+        "type": "fix",
+        "scope": "",
+        "message": "handle timeout",
+    }
+
+
+def test_parse_breaking_indicator():
+    """Test that the '!' marker makes a commit breaking"""
+    assert parse_conventional_commit("feat!: drop v1 api") == {
+        "type": "breaking",
+        "message": "drop v1 api",
+    }
+    assert parse_conventional_commit("fix(config)!: rename key") == {
+        "type": "breaking",
+        "message": "rename key",
+    }
+
+
+def test_parse_breaking_change_text():
+    """Test that 'BREAKING CHANGE' anywhere makes a commit breaking"""
+    assert parse_conventional_commit("docs: BREAKING CHANGE in config") == {
+        "type": "breaking",
+        "message": "BREAKING CHANGE in config",
+    }
+
+
+def test_parse_unknown_type():
+    """Test that non-conventional commits are reported as other"""
+    commit = "wip: something"
+    assert parse_conventional_commit(commit) == {"type": "other", "message": commit}
+
+
+@pytest.mark.parametrize(
+    "commit, expected",
+    [
+        # Scope containing ": " is only handled by the regex fallback
+        ("feat(a: b): x", {"type": "feat", "scope": "a: b", "message": "x"}),
+        # The regex ignores a single trailing newline
+        ("fix: trailing\n", {"type": "fix", "scope": "", "message": "trailing"}),
+        # Embedded newlines are not conventional subjects
+        ("fix: one\ntwo", {"type": "other", "message": "fix: one\ntwo"}),
+        # An empty scope is not a valid conventional commit
+        ("feat(): x", {"type": "other", "message": "feat(): x"}),
+        ("feat: ", {"type": "other", "message": "feat: "}),
+        ("feature: x", {"type": "other", "message": "feature: x"}),
+        ("feat(a)(b): x", {"type": "other", "message": "feat(a)(b): x"}),
+        ("ci((): x", {"type": "ci", "scope": "", "message": "x"}),
+        ("chore(deps)!: bump", {"type": "breaking", "message": "bump"}),
+        (
+            "feat(api): BREAKING CHANGE removed",
+            {"type": "breaking", "message": "BREAKING CHANGE removed"},
+        ),
+    ],
+)
+def test_parse_commit_edge_cases(commit, expected):
+    """Test that the fast path and regex fallback agree on unusual subjects"""
+    assert parse_conventional_commit(commit) == expected
+
+
+def test_iter_commits_without_tag(git_repo):
+    """Test that all commits are streamed oldest first"""
+    git_repo("commit", "-q", "--allow-empty", "-m", "feat: first")
+    git_repo("commit", "-q", "--allow-empty", "-m", "fix: second\n\nbody text")
+
+    assert list(iter_commits_since_tag()) == ["feat: first", "fix: second"]
+
+
+def test_iter_commits_since_tag(git_repo):
+    """Test that only commits after the tag are streamed"""
+    git_repo("commit", "-q", "--allow-empty", "-m", "feat: first")
+    git_repo("tag", "v1.0.0")
+    git_repo("commit", "-q", "--allow-empty", "-m", "fix: second")
+
+    assert list(iter_commits_since_tag("v1.0.0")) == ["fix: second"]
+
+
+def test_iter_commits_unknown_tag(git_repo):
+    """Test that a failing git log yields nothing"""
+    git_repo("commit", "-q", "--allow-empty", "-m", "feat: first")
+
+    assert list(iter_commits_since_tag("missing")) == []
+
+
+def test_categorize_commits_from_iterator():
+    """Test that categorization consumes a generator of commits"""
+    categories = categorize_commits(c for c in ["feat: add", "fix: repair"])
+
+    assert categories["feat"] == ["- add"]
+    assert categories["fix"] == ["- repair"]
+
+
+def test_categorize_commits_buckets():
+    """Test that each commit lands in its release notes section"""
+    categories = categorize_commits(
+        [
+            "feat!: new api",
+            "feat(ui): button",
+            "fix: crash",
+            "docs: readme",
+            "chore: deps",
+            "style: formatting",
+            "random commit",
+        ]
+    )
+
+    assert categories == {
+        "breaking": ["- **BREAKING**: new api"],
+        "feat": ["- button"],
+        "fix": ["- crash"],
+        "docs": ["- readme"],
+        "chore": ["- deps"],
+        # Types without a section keep their full subject
+        "other": ["- style: formatting", "- random commit"],
+    }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
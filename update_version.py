@@ -3,33 +3,37 @@
 
 import re
 from pathlib import Path
+from typing import Optional
 
-from version import get_version
+from version import read_version
 
+# Only the top-level version line, not versions nested in dependency tables
+_VERSION_RE = re.compile(r'^version = "[^"]*"', re.M)
 
-def update_pyproject_version():
-    """Update the version in pyproject.toml to match .version file."""
+
+def update_pyproject_version(version: Optional[str] = None):
+    """Update the version in pyproject.toml to match .version file.
+
+    Callers that already know the new version can pass it to skip re-reading
+    the .version file.
+    """
     pyproject_path = Path("pyproject.toml")
-    version = get_version()
+    if version is None:
+        version = read_version()
 
     if not pyproject_path.exists():
         print("pyproject.toml not found!")
         return
 
     # Read the current content
-    with open(pyproject_path, "r") as f:
-        content = f.read()
-
-    # Update the version line
-    pattern = r'version = "([^"]*)"'
-    replacement = f'version = "{version}"'
+    content = pyproject_path.read_text(encoding="utf-8")
 
-    if re.search(pattern, content):
-        new_content = re.sub(pattern, replacement, content)
+    # Update the version line in a single pass
+    new_content, count = _VERSION_RE.subn(f'version = "{version}"', content, count=1)
 
+    if count:
         # Write back the updated content
-        with open(pyproject_path, "w") as f:
-            f.write(new_content)
+        pyproject_path.write_text(new_content, encoding="utf-8")
 
         print(f"Updated pyproject.toml version to {version}")
     else:
@@ -4,19 +4,22 @@ import os
 from pathlib import Path
 
 
-def get_version() -> str:
-    """Get the current version from the .version file."""
+def read_version() -> str:
+    """Read the current version from the .version file."""
     version_file = Path(__file__).parent / ".version"
 
     if version_file.exists():
-        with open(version_file, "r") as f:
-            version = f.read().strip()
-            return version
+        return version_file.read_text(encoding="ascii").strip()
 
     # Fallback version if .version file doesn't exist
     return "0.0.0"
 
 
+def get_version() -> str:
+    """Get the application version, as read once at import time."""
+    return __version__
+
+
 def get_app_info() -> dict:
     """Get application information including version."""
     return {
@@ -27,4 +30,4 @@ def get_app_info() -> dict:
 
 
 # Export version for easy access
-__version__ = get_version()
+__version__ = read_version()